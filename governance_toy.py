@@ -7,136 +7,107 @@ so that they are few experts for any given problem.
 The sums of the preference values for each problem create a set of unique values greater than 0.
 Preference values are assigned randomly to agents.
 
-Two steps are allowed: 1) ask an agent for its highest unknown problem/preference pair, 2) ask an agent 
-or agents to attempt to solve a problem (each agent votes for the correct or incorrect answer according 
+Two steps are allowed: 1) ask an agent for its highest unknown problem/preference pair, 2) ask an agent
+or agents to attempt to solve a problem (each agent votes for the correct or incorrect answer according
 to their expertise in the problem).
 
 The goal is to solve the agents' top 10 preferred problems in the fewest steps (time)
 and the fewest total problems solved (resources).
 
 Three algorithms are tested here:
-1) "Paradox" - Meant to solve the paradox of democracy requiring each group member to have equal influence 
-to be fair and experts to have extra influence to be effective, this algorithm first discovers the top 10 
+1) "Paradox" - Meant to solve the paradox of democracy requiring each group member to have equal influence
+to be fair and experts to have extra influence to be effective, this algorithm first discovers the top 10
 preferred problems in as few steps as it can, then asks only the experts in those problems to solve them.
 
-2) "Technocracy" - Simply asks the experts in each problem to solve it. This algorithm saves time by not 
-bothering with preferences but has to solve way more than the required 10 problems since it knows nothing 
+2) "Technocracy" - Simply asks the experts in each problem to solve it. This algorithm saves time by not
+bothering with preferences but has to solve way more than the required 10 problems since it knows nothing
 about preferences.
 
-3) "Direct democracy" - Starts by discovering preferences exactly like "Paradox", but instead of asking 
-only experts to solve, asks everyone. Because expertise is handed out by e = x^^4 for a random x between 
+3) "Direct democracy" - Starts by discovering preferences exactly like "Paradox", but instead of asking
+only experts to solve, asks everyone. Because expertise is handed out by e = x^^4 for a random x between
 0 and 1, experts in any given problem are a minority, and this algorithm struggles to solve any of the problems.
 """
 
-import random
-from random import shuffle
-import matplotlib.pyplot as plt
+import argparse
+from functools import lru_cache
+from multiprocessing import Pool
+
 import numpy as np
+from numba import njit
+
+rng = np.random.default_rng()
 
 # SET UP
+# Problems are numbered 0..number_of_problems-1. Agents and problems each get a row/column in the
+# preference and expertise matrices, so everything downstream is plain array indexing.
+# deterministic per-size scaffolding, cached across trials of the same size (callers must not mutate)
+@lru_cache(maxsize=None)
+def problem_totals_template(number_of_problems):
+	return np.arange(number_of_problems, 0, -1, dtype=np.float32)
+
+@lru_cache(maxsize=None)
+def all_agent_ids(number_of_agents):
+	return np.arange(number_of_agents)
+
 def create_problems_dict(number_of_problems, number_of_agents):
-	problems = []
-	total = number_of_problems
-	while number_of_problems > 0:
-		problems.append('problem'+str(number_of_problems))
-		number_of_problems -= 1
-	shuffle(problems)
-	problems_dict = {}
-	top_problems_dict = {}
-	top_problem_count = 0
-	for problem in problems:
-		problems_dict[problem] = total
-		if top_problem_count < 10:
-			top_problems_dict[problem] = {'pref_total': total, 'solved': False}
-			top_problem_count += 1
-		total -= 1
-	return [problems_dict, top_problems_dict]
-
-def create_agents(number_of_agents):
-	agents = {}
-	known_preferences = {}
-	while number_of_agents > 0:
-		agents[number_of_agents] = {'preferences': {}, 'expertise': {}}
-		known_preferences[number_of_agents] = {}
-		number_of_agents -= 1
-	return [agents, known_preferences]
-
-def assign_preferences(agents, problems_dict):
-	agent_keys = agents.keys()
-	for problem in problems_dict:
-		preference_fractions = []
-		preference_denom = 0
-		for agent in agents:
-			rand = random.random()
-			preference_fractions.append(rand)
-			preference_denom += rand
-		for rand in preference_fractions:
-			preference_fractions[preference_fractions.index(rand)] = round(
-					rand/preference_denom*problems_dict[problem], 1)
-		shuffle(agent_keys)
-		for agent in agent_keys:
-			agents[agent]['preferences'][problem] = preference_fractions[int(agent)-1]
-	return agents
-
-def assign_expertise(agents, problems):
-	for agent in agents.keys():
-		for problem in problems:
-			agents[agent]['expertise'][problem] = round(random.random()**4, 4)
-	return agents
+	totals = rng.permutation(problem_totals_template(number_of_problems))
+	top_problem_ids = np.argsort(-totals)[:10].astype(np.int32)
+	return [totals, top_problem_ids]
+
+def assign_preferences(number_of_agents, totals):
+	preference_fractions = rng.random((number_of_agents, len(totals)), dtype=np.float32)
+	preference_denoms = preference_fractions.sum(axis=0, keepdims=True)
+	preferences = np.round(preference_fractions/preference_denoms*totals[None, :], 1)
+	return preferences
+
+def assign_expertise(number_of_agents, number_of_problems):
+	return np.round(rng.random((number_of_agents, number_of_problems), dtype=np.float32)**4, 4)
 
 def init(number_of_agents, number_of_problems):
-	problem_dicts = create_problems_dict(number_of_problems, number_of_agents)
-	problems_dict = problem_dicts[0]
-	top_problems_dict = problem_dicts[1]
-	agent_dicts = create_agents(number_of_agents)
-	agents = agent_dicts[0]
-	agents = assign_preferences(agents, problems_dict)
-	agents = assign_expertise(agents, problems_dict.keys())
-	known_preferences = agent_dicts[1]
-	return [agents, top_problems_dict, known_preferences]
+	problem_arrays = create_problems_dict(number_of_problems, number_of_agents)
+	totals = problem_arrays[0]
+	top_problem_ids = problem_arrays[1]
+	preferences = assign_preferences(number_of_agents, totals)
+	expertise = assign_expertise(number_of_agents, number_of_problems)
+	solved = np.zeros(number_of_problems, dtype=bool)
+	known = np.zeros((number_of_agents, number_of_problems), dtype=bool)
+	return [preferences, expertise, top_problem_ids, solved, known]
 
 # ALGORITHMS
 # Paradox: first survey preferences to find top preffered problems, then ask only experts in those problems to solve them.
+# The whole trial - survey, top-k selection, expert lookup and solve loop - runs inside one compiled
+# kernel (run_paradox_trial); this wrapper only does setup and unpacks the result.
 def paradox_solve(number_of_agents, number_of_problems):
 	# set up
-	initial_dicts = init(number_of_agents, number_of_problems)
-	agents = initial_dicts[0]
-	top_problems_dict = initial_dicts[1]
-	known_preferences = initial_dicts[2]
-	
-	# ask preferences
+	initial_arrays = init(number_of_agents, number_of_problems)
+	preferences = initial_arrays[0]
+	expertise = initial_arrays[1]
+	top_problem_ids = initial_arrays[2]
+	solved = initial_arrays[3]
+	known = initial_arrays[4]
+
 	if number_of_problems > number_of_agents:
-		starting_steps = number_of_problems 
-	else: 
+		starting_steps = number_of_problems
+	else:
 		starting_steps = number_of_agents
-	preferences_list = search_for_top_preferences(starting_steps, agents, known_preferences, top_problems_dict, [], 0, {})
-	steps = preferences_list[0]
-	contain_percentage = preferences_list[1]
-	hypothesized_top_problems = preferences_list[2]
-	known_preferences = preferences_list[3]
-
-	# ask experts to solve preferred problems
-	solve = ask_experts_to_solve(agents, hypothesized_top_problems, steps, top_problems_dict, 0.5)
-	if solve[0] == 100:
-		return [solve[0], solve[1], solve[2]]
-		"Paradox solved the top 10 preferred problems in "+str(solve[1])+" steps. Total problems solved: "+str(solve[2])
-	elif solve[0] == 0:
-		return [solve[0], solve[1], solve[2]]
-		"Paradox failed to solve the top 10 preferred problems in "+str(solve[1])+" steps. Total problems solved: "+str(solve[2])
-	elif solve[0] == -1:
+	trial = run_paradox_trial(preferences, expertise, top_problem_ids, known, solved,
+							  starting_steps, 0.5, int(rng.integers(2**32)))
+	if trial[0] == -1:
 		return [-1]
-		"Paradox failed because it exceeded the max number of steps."
+	return [trial[0], trial[1], trial[2]]
 
 # Technocracy: ask experts in each problem to solve the problem, ignoring preferences (solves all the problems).
 def technocracy_solve(number_of_agents, number_of_problems):
 	# set up
-	initial_dicts = init(number_of_agents, number_of_problems)
-	agents = initial_dicts[0]
-	top_problems_dict = initial_dicts[1]
-	known_preferences = initial_dicts[2]
+	initial_arrays = init(number_of_agents, number_of_problems)
+	preferences = initial_arrays[0]
+	expertise = initial_arrays[1]
+	top_problem_ids = initial_arrays[2]
+	solved = initial_arrays[3]
+	known = initial_arrays[4]
 
 	# ask experts to solve all problems
-	solve = ask_experts_to_solve(agents, agents[1]['preferences'].keys(), 0, top_problems_dict, 0.5)
+	solve = ask_experts_to_solve(expertise, range(number_of_problems), 0, top_problem_ids, solved, 0.5)
 	if solve[0] == 100:
 		return [solve[0], solve[1], solve[2]]
 		"Technocracy solved the top 10 preferred problems in "+str(solve[1])+" steps. Total problems solved: "+str(solve[2])
@@ -147,28 +118,30 @@ def technocracy_solve(number_of_agents, number_of_problems):
 		return [-1]
 		"Technocracy failed because it exceeded the max number of steps."
 
-# Direct Democracy: first survey preferences, then ask everyone to solve each top problem 
+# Direct Democracy: first survey preferences, then ask everyone to solve each top problem
 # (probably fails with runtime error).
 def direct_dem_solve(number_of_agents, number_of_problems):
 	# set up
-	initial_dicts = init(number_of_agents, number_of_problems)
-	agents = initial_dicts[0]
-	top_problems_dict = initial_dicts[1]
-	known_preferences = initial_dicts[2]
+	initial_arrays = init(number_of_agents, number_of_problems)
+	preferences = initial_arrays[0]
+	expertise = initial_arrays[1]
+	top_problem_ids = initial_arrays[2]
+	solved = initial_arrays[3]
+	known = initial_arrays[4]
 
 	# ask preferences
 	if number_of_problems > number_of_agents:
-		starting_steps = number_of_problems 
-	else: 
+		starting_steps = number_of_problems
+	else:
 		starting_steps = number_of_agents
-	preferences_list = search_for_top_preferences(starting_steps, agents, known_preferences, top_problems_dict, [], 0, {})
+	preferences_list = search_for_top_preferences(starting_steps, preferences, known, top_problem_ids)
 	steps = preferences_list[0]
 	contain_percentage = preferences_list[1]
 	hypothesized_top_problems = preferences_list[2]
-	known_preferences = preferences_list[3]
+	known = preferences_list[3]
 
 	# ask for solves
-	solve = ask_experts_to_solve(agents, hypothesized_top_problems, 0, top_problems_dict, 0)
+	solve = ask_experts_to_solve(expertise, hypothesized_top_problems, 0, top_problem_ids, solved, 0)
 	if solve[0] == 100:
 		return [solve[0], solve[1], solve[2]]
 		"Direct democracy solved the top 10 preferred problems in "+str(solve[1])+" steps. Total problems solved: "+str(solve[2])
@@ -181,232 +154,288 @@ def direct_dem_solve(number_of_agents, number_of_problems):
 
 # SUPPORT FUNCTIONS
 # ask an agent what it's top unknown preference is. steps +1
-def ask_for_preference(agent_to_ask, agents, known_preferences):
-	next_top_preference = ['', -1]
-	for problem in agents[agent_to_ask]['preferences']:
-		if problem in known_preferences[agent_to_ask]:
-			continue
-		else:
-			if agents[agent_to_ask]['preferences'][problem] > next_top_preference[1]:
-				next_top_preference = [problem, agents[agent_to_ask]['preferences'][problem]]
-	if next_top_preference != ['', -1]:
-		known_preferences[agent_to_ask][next_top_preference[0]] = next_top_preference[1]
-	return known_preferences
+@njit(cache=True)
+def ask_for_preference(agent_to_ask, preferences, known):
+	masked = np.where(known[agent_to_ask], -np.inf, preferences[agent_to_ask])
+	next_top_problem = int(masked.argmax())
+	if masked[next_top_problem] > -np.inf:
+		known[agent_to_ask, next_top_problem] = True
+	return known
 
 # ask an agent(s) to attempt solving a specific problem. return boolean if they solved it. steps +1
-def ask_for_solve(agents_to_ask, problem, agents, top_problems_dict):
-	agents_succeeded = 0
-	agents_failed = 0
-	for agent in agents_to_ask:
-		if round(random.random(), 4) < agents[agent]['expertise'][problem]:
-			agents_succeeded += 1
-		else:
-			agents_failed += 1
-	if agents_succeeded > agents_failed:
-		if problem in top_problems_dict: 
-			top_problems_dict[problem]['solved'] = True
-		if check_for_win(top_problems_dict) == True:
-			return 100
-		else:
-			return [True, top_problems_dict]
-	else:
-		return [False, top_problems_dict]
-
-# Win condition
-def check_for_win(top_problems_dict):
-	for problem in top_problems_dict:
-		if top_problems_dict[problem]['solved'] == False:
-			return False
-	return True
+def ask_for_solve(agents_to_ask, problem, expertise):
+	agent_ids = np.asarray(agents_to_ask)
+	draws = rng.random(agent_ids.size, dtype=np.float32)
+	agents_succeeded = int((draws < expertise[agent_ids, problem]).sum())
+	return agents_succeeded*2 > agent_ids.size
 
 # Compare two lists
 def list1_contain_list2(list1, list2):
-	differences = 0
-	for element2 in list2:
-		same_element_present = False
-		for element1 in list1:
-			if element1 == element2: same_element_present = True
-		if same_element_present == False: differences += 1
-	contain_percentage = int((len(list2)-differences)/float(len(list2))*100)
+	contain_percentage = int(np.isin(np.asarray(list2), np.asarray(list1)).mean()*100)
 	return contain_percentage
 
 # search for top 10 preferred problems
-def search_for_top_preferences(number_of_agents, agents, known_preferences, top_problems_dict, 
-							   hypothesized_top_problems, steps, top_problem_log):
+def search_for_top_preferences(number_of_agents, preferences, known, top_problem_ids):
 	preference_search_steps = int(number_of_agents*.5)+1
-	ask_preferences_list = paradox_ask_preferences(preference_search_steps, agents, known_preferences, 
-												   hypothesized_top_problems, top_problem_log)
-	hypothesized_top_problems = ask_preferences_list[0]
-	steps += ask_preferences_list[1]
-	known_preferences = ask_preferences_list[2]
-	top_problem_log = ask_preferences_list[3]
-	contain_percentage = list1_contain_list2(hypothesized_top_problems, top_problems_dict)
-	if contain_percentage < 100:
-		return search_for_top_preferences(preference_search_steps, agents, known_preferences, top_problems_dict, 
-										  hypothesized_top_problems, steps, top_problem_log)
-	elif contain_percentage == 100:
-		return [steps, contain_percentage, hypothesized_top_problems, known_preferences]
-
-def paradox_ask_preferences(number_of_steps, agents, known_preferences, hypothesized_top_problems, 
-							top_problem_log):
+	number_of_problems = preferences.shape[1]
+	max_steps = number_of_problems*100
+	top_problem_log = np.zeros(number_of_problems, dtype=np.float32)
+	hypothesized_top_problems = np.empty(number_of_problems, dtype=np.int32)
+	hypothesized_count = 0
+	top_probs_per_round = min(10 + int(.1*number_of_problems), number_of_problems)
+	steps = 0
+	while True:
+		# each round restarts from agent 0, matching the old recursion
+		round_list = paradox_ask_preferences(preference_search_steps, preferences, known,
+											 top_problem_log, 0)
+		steps += round_list[0]
+		if steps > max_steps:
+			raise RuntimeError('Exceeded maximum steps, doofus! Steps: '+str(steps))
+		# take the top preferred problems not hypothesized yet
+		masked_log = np.where(top_problem_log > 0, top_problem_log, -np.inf)
+		masked_log[hypothesized_top_problems[:hypothesized_count]] = -np.inf
+		top_probs = np.argpartition(masked_log, -top_probs_per_round)[-top_probs_per_round:]
+		for top_prob in top_probs[np.argsort(-masked_log[top_probs])]:
+			if masked_log[top_prob] == -np.inf:
+				break
+			hypothesized_top_problems[hypothesized_count] = top_prob
+			hypothesized_count += 1
+		contain_percentage = list1_contain_list2(hypothesized_top_problems[:hypothesized_count],
+												 top_problem_ids)
+		if contain_percentage == 100:
+			return [steps, contain_percentage, hypothesized_top_problems[:hypothesized_count], known]
+		# rounds shrink geometrically like the old recursion, which passed the round size
+		# back in as the agent count
+		preference_search_steps = int(preference_search_steps*.5)+1
+
+@njit(cache=True)
+def paradox_ask_preferences(number_of_steps, preferences, known, top_problem_log, start_agent):
 	steps = 0
-	agentid = 1
+	agentid = start_agent
 	# ask preferences
 	while steps < number_of_steps:
-		known_preferences = ask_for_preference(agentid, agents, known_preferences)
+		known = ask_for_preference(agentid, preferences, known)
 		steps += 1
-		if steps > len(agents[1]['preferences'])*100:
-			raise RuntimeError('Exceeded maximum steps, doofus! Steps: '+str(steps))
 		agentid += 1
-		if agentid > len(agents.keys()): agentid -= len(agents.keys())
+		if agentid >= preferences.shape[0]: agentid -= preferences.shape[0]
 	# add up known preferences
-	for agent in agents:
-		n = len(agents[agent]['preferences'].keys())
-		while n > 0:
-			if 'problem'+str(n) in known_preferences[agent]:
-				if 'problem'+str(n) in top_problem_log:
-					top_problem_log['problem'+str(n)] += known_preferences[agent]['problem'+str(n)]
-				else:
-					top_problem_log['problem'+str(n)] = known_preferences[agent]['problem'+str(n)]
-			n -= 1
-	# take top 10 preferred problems
-	top_probs_remaining = 10 + int(.1*len(agents[1]['preferences']))
-	while top_probs_remaining > 0:
-		if len(top_problem_log.keys()) > 0:
-			top_prob = max(top_problem_log, key=top_problem_log.get)
-			if top_prob not in hypothesized_top_problems: hypothesized_top_problems.append(top_prob)
-			del top_problem_log[top_prob]
-			top_probs_remaining -= 1
-		else:
-			break
-	return [hypothesized_top_problems, steps, known_preferences, top_problem_log]
-
-def ask_experts_to_solve(agents, hypothesized_top_problems, steps, top_problems_dict, expertise_cutoff):
+	top_problem_log[:] = 0
+	for agent in range(preferences.shape[0]):
+		for problem in range(preferences.shape[1]):
+			if known[agent, problem]:
+				top_problem_log[problem] += preferences[agent, problem]
+	return steps, agentid
+
+def ask_experts_to_solve(expertise, hypothesized_top_problems, steps, top_problem_ids, solved, expertise_cutoff):
 	if expertise_cutoff > 1 or expertise_cutoff < 0:
 		raise ValueError('Expertise cutoff must be between 0 and 1.')
+	expert_mask = expertise >= expertise_cutoff
 	experts = {}
 	new_steps = steps
+	max_steps = expertise.shape[1]*100
 	for problem in hypothesized_top_problems:
-		experts[problem] = []
-		for agent in agents:
-			if agents[agent]['expertise'][problem] >= expertise_cutoff:
-				experts[problem].append(agent)
+		experts[problem] = np.flatnonzero(expert_mask[:, problem])
+	# win condition is an O(1) counter: count top problems as they transition to solved
+	top_mask = np.zeros(expertise.shape[1], dtype=bool)
+	top_mask[top_problem_ids] = True
+	solved_top_count = int(solved[top_problem_ids].sum())
 	total_problems_solved = 0
 	# if expert found, ask them to solve until it's solved. if not, ask the whole group to solve until it's solved.
 	for problem in hypothesized_top_problems:
-		solved = False
-		if len(experts[problem]) > 0:
-			while solved == False:
-				solve_list = ask_for_solve(experts[problem], problem, agents, top_problems_dict)
-				new_steps += 1
-				if new_steps > len(agents[1]['preferences'])*100:
-					return [-1]
-				if solve_list == 100: 
-					total_problems_solved += 1
-					return [100, new_steps, total_problems_solved]
-				solved = solve_list[0]
-				top_problems_dict = solve_list[1]
-			total_problems_solved += 1
+		if experts[problem].size > 0:
+			agents_to_ask = experts[problem]
 		else:
-			while solved == False:
-				solve_list = ask_for_solve(agents.keys(), problem, agents, top_problems_dict)
-				new_steps += 1
-				if new_steps > len(agents[1]['preferences'])*100:
-					return [-1]
-				if solve_list == 100: 
-					total_problems_solved += 1
+			agents_to_ask = all_agent_ids(expertise.shape[0])
+		problem_solved = False
+		while problem_solved == False:
+			problem_solved = ask_for_solve(agents_to_ask, problem, expertise)
+			new_steps += 1
+			if new_steps > max_steps:
+				return [-1]
+		total_problems_solved += 1
+		if not solved[problem]:
+			solved[problem] = True
+			if top_mask[problem]:
+				solved_top_count += 1
+				if solved_top_count == top_problem_ids.size:
 					return [100, new_steps, total_problems_solved]
-				solved = solve_list[0]
-				top_problems_dict = solve_list[1]
-			total_problems_solved += 1
 	return [0, new_steps, total_problems_solved]
 
+# the fused paradox trial: everything after setup happens in compiled code, no Python calls per step.
+# Draws come from numba's internal RNG, seeded per trial from the module generator.
+@njit(cache=True)
+def run_paradox_trial(preferences, expertise, top_problem_ids, known, solved,
+					  starting_steps, expertise_cutoff, seed):
+	np.random.seed(seed)
+	number_of_agents = preferences.shape[0]
+	number_of_problems = preferences.shape[1]
+	max_steps = number_of_problems*100
+	preference_search_steps = int(starting_steps*.5)+1
+	top_probs_per_round = min(10 + int(.1*number_of_problems), number_of_problems)
+	top_problem_log = np.zeros(number_of_problems, dtype=np.float32)
+	hypothesized_top_problems = np.empty(number_of_problems, dtype=np.int32)
+	hypothesized_mask = np.zeros(number_of_problems, dtype=np.bool_)
+	hypothesized_count = 0
+	top_mask = np.zeros(number_of_problems, dtype=np.bool_)
+	for problem in top_problem_ids:
+		top_mask[problem] = True
+	tops_hypothesized = 0
+	steps = 0
+	# survey preferences until every top problem is hypothesized; each round restarts
+	# from agent 0 and rounds shrink geometrically, like the old recursion
+	while tops_hypothesized < top_problem_ids.size:
+		round_steps = 0
+		agentid = 0
+		while round_steps < preference_search_steps:
+			ask_for_preference(agentid, preferences, known)
+			round_steps += 1
+			agentid += 1
+			if agentid >= number_of_agents: agentid -= number_of_agents
+		steps += round_steps
+		if steps > max_steps:
+			raise RuntimeError('Exceeded maximum steps, doofus!')
+		# add up known preferences
+		top_problem_log[:] = 0
+		for agent in range(number_of_agents):
+			for problem in range(number_of_problems):
+				if known[agent, problem]:
+					top_problem_log[problem] += preferences[agent, problem]
+		# take the top preferred problems not hypothesized yet
+		masked_log = np.empty(number_of_problems, dtype=np.float32)
+		for problem in range(number_of_problems):
+			if hypothesized_mask[problem] or top_problem_log[problem] <= 0:
+				masked_log[problem] = -np.inf
+			else:
+				masked_log[problem] = top_problem_log[problem]
+		order = np.argsort(-masked_log)
+		for i in range(top_probs_per_round):
+			problem = order[i]
+			if masked_log[problem] == -np.inf:
+				break
+			hypothesized_top_problems[hypothesized_count] = problem
+			hypothesized_count += 1
+			hypothesized_mask[problem] = True
+			if top_mask[problem]:
+				tops_hypothesized += 1
+		preference_search_steps = int(preference_search_steps*.5)+1
+	# ask the experts in each hypothesized problem to solve it (the whole group if there are none)
+	expert_ids = np.empty(number_of_agents, dtype=np.int32)
+	solved_top_count = 0
+	total_problems_solved = 0
+	for i in range(hypothesized_count):
+		problem = hypothesized_top_problems[i]
+		expert_count = 0
+		for agent in range(number_of_agents):
+			if expertise[agent, problem] >= expertise_cutoff:
+				expert_ids[expert_count] = agent
+				expert_count += 1
+		problem_solved = False
+		while not problem_solved:
+			agents_succeeded = 0
+			if expert_count > 0:
+				group_size = expert_count
+				for j in range(expert_count):
+					if np.random.random() < expertise[expert_ids[j], problem]:
+						agents_succeeded += 1
+			else:
+				group_size = number_of_agents
+				for agent in range(number_of_agents):
+					if np.random.random() < expertise[agent, problem]:
+						agents_succeeded += 1
+			problem_solved = agents_succeeded*2 > group_size
+			steps += 1
+			if steps > max_steps:
+				return (-1, steps, total_problems_solved)
+		total_problems_solved += 1
+		if not solved[problem]:
+			solved[problem] = True
+			if top_mask[problem]:
+				solved_top_count += 1
+				if solved_top_count == top_problem_ids.size:
+					return (100, steps, total_problems_solved)
+	return (0, steps, total_problems_solved)
+
+def run_seeded_trial(solve_function_name, number_of_agents, number_of_problems, seed_sequence):
+	# reseed the module rng so every trial gets an independent stream in every worker
+	global rng
+	rng = np.random.default_rng(seed_sequence)
+	return solve_function_name(number_of_agents, number_of_problems)
+
 def run_trial(solve_function_name, number_of_agents, number_of_problems, number_of_trials):
+	seed_sequences = np.random.SeedSequence().spawn(number_of_trials)
+	with Pool() as pool:
+		results = pool.starmap(run_seeded_trial,
+							   [(solve_function_name, number_of_agents, number_of_problems, seed_sequence)
+								for seed_sequence in seed_sequences])
 	steps = []
-	steps_total = 0
 	problems_solved = []
-	problems_solved_total = 0
 	fails = 0
-	trials = number_of_trials
-	while trials > 0:
-		data = solve_function_name(number_of_agents, number_of_problems)
+	for data in results:
 		if data[0] == 100:
 			steps.append(data[1])
-			steps_total += data[1]
 			problems_solved.append(data[2])
-			problems_solved_total += data[2]
 		elif data[0] == -1:
 			fails += 1
-		trials -= 1
-		print str(trials)+' trials left.'
-	steps_mean = steps_total/len(steps)
-	problems_solved_mean = problems_solved_total/len(problems_solved)
+	steps_mean = sum(steps)/len(steps)
+	problems_solved_mean = sum(problems_solved)/len(problems_solved)
 	return [steps, problems_solved, fails, steps_mean, problems_solved_mean]
 
-# RUN
-number_of_agents = 100
-number_of_problems = 100
-number_of_trials = 2000
-
-paradox_data = run_trial(paradox_solve, number_of_agents, number_of_problems, number_of_trials)
-technocracy_data = run_trial(technocracy_solve, number_of_agents, number_of_problems, number_of_trials)
-steps_range = (40, 160)
-bins = 50
-problems_range = (10, 100)
-plt.rcParams["font.size"] = 12
-plt.rcParams["axes.titlesize"] = 20
-plt.rcParams["axes.labelsize"] = 16
-
-# Paradox Graphs
-# Steps
-plt.figure(1, figsize=(9,9))
-plt.hist(paradox_data[0], bins, steps_range, color='purple', histtype='bar', rwidth=0.8)
-plt.xlabel('Steps')
-plt.ylabel('Trials (2000 total)')
-plt.title(
-	'Two-layered - Steps (mean = '+str(paradox_data[3])+')', 
-	y=1.04)
-plt.axis([40, 160, 0, int(number_of_trials*.25)])
-plt.xticks(np.arange(40, 160, step=20))
-plt.axvline(paradox_data[3], color='k', linestyle='dashed', linewidth=1)
-
-# Problems Solved
-plt.figure(2, figsize=(9,9))
-plt.hist(paradox_data[1], bins, problems_range, color='purple', histtype='bar', rwidth=0.8)
-plt.xlabel('Problems Solved')
-plt.ylabel('Trials (2000 total)')
-plt.title(
-	'Two-layered - Total Problems Solved (mean = '+str(paradox_data[4])+')', 
-	y=1.04)
-plt.axis([10, 100, 0, int(number_of_trials*.25)])
-plt.xticks(np.arange(10, 100, step=10))
-plt.axvline(paradox_data[4], color='k', linestyle='dashed', linewidth=1)
-
-
-# Technocracy Graphs
-# Steps
-plt.figure(3, figsize=(9,9))
-plt.hist(technocracy_data[0], bins, steps_range, color='yellow', histtype='bar', rwidth=0.8)
-plt.xlabel('Steps')
-plt.ylabel('Trials (2000 total)')
-plt.title(
-	'Experts-only - Steps (mean = '+str(technocracy_data[3])+')',
-	y=1.04)
-plt.axis([40, 160, 0, int(number_of_trials*.25)])
-plt.xticks(np.arange(40, 160, step=20))
-plt.axvline(technocracy_data[3], color='k', linestyle='dashed', linewidth=1)
-
-# Problems Solved
-plt.figure(4, figsize=(9,9))
-plt.hist(technocracy_data[1], bins, problems_range, color='yellow', histtype='bar', rwidth=0.8)
-plt.xlabel('Problems Solved')
-plt.ylabel('Trials (2000 total)')
-plt.title(
-	'Experts-only - Total Problems Solved (mean = '+str(technocracy_data[4])+')', 
-	y=1.04)
-plt.axis([10, 100, 0, int(number_of_trials*.25)])
-plt.xticks(np.arange(10, 100, step=10))
-plt.axvline(technocracy_data[4], color='k', linestyle='dashed', linewidth=1)
-
-plt.show()
+# PLOTTING
+def plot_results(figure_configs, number_of_trials):
+	# matplotlib is imported here so Pool workers never pay for (or fork) its state
+	import matplotlib.pyplot as plt
+	steps_range = (40, 160)
+	bins = 50
+	problems_range = (10, 100)
+	plt.rcParams["font.size"] = 12
+	plt.rcParams["axes.titlesize"] = 20
+	plt.rcParams["axes.labelsize"] = 16
+	figure_number = 1
+	for label, data, color in figure_configs:
+		# Steps
+		plt.figure(figure_number, figsize=(9,9))
+		plt.hist(data[0], bins, steps_range, color=color, histtype='bar', rwidth=0.8)
+		plt.xlabel('Steps')
+		plt.ylabel('Trials ('+str(number_of_trials)+' total)')
+		plt.title(
+			label+' - Steps (mean = '+str(data[3])+')',
+			y=1.04)
+		plt.axis([40, 160, 0, int(number_of_trials*.25)])
+		plt.xticks(np.arange(40, 160, step=20))
+		plt.axvline(data[3], color='k', linestyle='dashed', linewidth=1)
+
+		# Problems Solved
+		plt.figure(figure_number+1, figsize=(9,9))
+		plt.hist(data[1], bins, problems_range, color=color, histtype='bar', rwidth=0.8)
+		plt.xlabel('Problems Solved')
+		plt.ylabel('Trials ('+str(number_of_trials)+' total)')
+		plt.title(
+			label+' - Total Problems Solved (mean = '+str(data[4])+')',
+			y=1.04)
+		plt.axis([10, 100, 0, int(number_of_trials*.25)])
+		plt.xticks(np.arange(10, 100, step=10))
+		plt.axvline(data[4], color='k', linestyle='dashed', linewidth=1)
+		figure_number += 2
+	plt.show()
 
+# RUN
+def main():
+	parser = argparse.ArgumentParser(description='Simulate the governance algorithms.')
+	parser.add_argument('--plot', action='store_true', help='show the results histograms')
+	args = parser.parse_args()
+
+	number_of_agents = 100
+	number_of_problems = 100
+	number_of_trials = 2000
+
+	paradox_data = run_trial(paradox_solve, number_of_agents, number_of_problems, number_of_trials)
+	technocracy_data = run_trial(technocracy_solve, number_of_agents, number_of_problems, number_of_trials)
+
+	if args.plot:
+		plot_results([
+			('Two-layered', paradox_data, 'purple'),
+			('Experts-only', technocracy_data, 'yellow'),
+		], number_of_trials)
+
+if __name__ == '__main__':
+	main()